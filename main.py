@@ -4,7 +4,19 @@ import pygame
 
 import math
 import sys
+import numpy as np
 import pygame
+
+try:
+	from numba import njit
+except ImportError:
+	# numba is optional; without it the physics kernels run as plain Python
+	def njit(*args, **kwargs):
+		if len(args) == 1 and callable(args[0]):
+			return args[0]
+		return lambda func: func
+
+
 def show_popup(screen, font, big_font, lines, window_width, window_height):
 	# Draw a modal popup in the center of the screen
 	popup_w, popup_h = 520, 400  # Further increased size
@@ -35,6 +47,7 @@ def show_popup(screen, font, big_font, lines, window_width, window_height):
 WINDOW_WIDTH = 960
 WINDOW_HEIGHT = 600
 FPS = 60
+IDLE_FPS = 30  # frame rate while the simulation is not running
 
 BACKGROUND_COLOR = (18, 18, 22)
 TEXT_COLOR = (230, 230, 235)
@@ -46,6 +59,15 @@ GRID_COLOR = (40, 44, 52)
 SIM_COLOR = (255, 200, 100)
 TRAIL_COLOR = (150, 200, 255)
 VECTOR_COLOR = (255, 100, 100)
+TRAIL_FADE_STEPS = 8  # number of color buckets used to draw the fading trail
+# Trail fade colors, oldest (dimmest) bucket first
+TRAIL_FADE_COLORS = [
+	tuple(int(c * (b + 1) / TRAIL_FADE_STEPS) for c in TRAIL_COLOR) for b in range(TRAIL_FADE_STEPS)
+]
+
+# Velocity arrow head barbs are rotated +/-0.5 rad from the shaft
+ARROW_HEAD_COS = math.cos(0.5)
+ARROW_HEAD_SIN = math.sin(0.5)
 
 GRAVITY = 9.81  # m/s^2
 
@@ -64,6 +86,9 @@ class TextInput:
 		self.cursor_timer = 0.0
 		self.cursor_interval = 0.6
 		self.invalid = False
+		# Rendered text is reused until self.text changes
+		self._cached_text = None
+		self._cached_surf = None
 
 	def handle_event(self, event):
 		if event.type == pygame.MOUSEBUTTONDOWN:
@@ -111,18 +136,31 @@ class TextInput:
 		pygame.draw.rect(surface, bg, self.rect, border_radius=6)
 		pygame.draw.rect(surface, GRID_COLOR if not self.invalid else ERROR_COLOR, self.rect, width=1, border_radius=6)
 
-		display_text = self.text if self.text != "" else self.placeholder
-		color = TEXT_COLOR if self.text != "" else (160, 160, 170)
-		render = self.font.render(display_text, True, color)
+		if self.text != self._cached_text:
+			display_text = self.text if self.text != "" else self.placeholder
+			color = TEXT_COLOR if self.text != "" else (160, 160, 170)
+			self._cached_surf = self.font.render(display_text, True, color)
+			self._cached_text = self.text
+		render = self._cached_surf
 		surface.blit(render, (self.rect.x + 10, self.rect.y + (self.rect.height - render.get_height()) // 2))
 
 		if self.focused:
-			cursor_x = self.rect.x + 10 + render.get_width()
-			cursor_y = self.rect.y + 8
+			cursor_x, cursor_top, cursor_bottom = self._cursor_line()
 			if self.cursor_visible:
-				pygame.draw.line(surface, TEXT_COLOR, (cursor_x, cursor_y), (cursor_x, self.rect.bottom - 8), 1)
+				pygame.draw.line(surface, TEXT_COLOR, (cursor_x, cursor_top), (cursor_x, cursor_bottom), 1)
+
+	def _cursor_line(self):
+		# Cursor x, top and bottom: just right of the rendered text
+		text_w = self._cached_surf.get_width() if self._cached_surf is not None else 0
+		return self.rect.x + 10 + text_w, self.rect.y + 8, self.rect.bottom - 8
+
+	def cursor_rect(self):
+		# Screen area covered by the blinking cursor drawn in draw()
+		cursor_x, cursor_top, cursor_bottom = self._cursor_line()
+		return pygame.Rect(cursor_x - 1, cursor_top, 3, cursor_bottom - cursor_top + 1)
 
 # yo wassup EGO 
+@njit(cache=True, fastmath=True)
 def compute_delta_y_from_speeds(initial_speed, final_speed, gravity):
 	"""
 	Compute vertical displacement needed so that impact speed equals final_speed,
@@ -132,6 +170,7 @@ def compute_delta_y_from_speeds(initial_speed, final_speed, gravity):
 	return (final_speed * final_speed - initial_speed * initial_speed) / (2.0 * gravity)
 
 
+@njit(cache=True, fastmath=True)
 def solve_time_of_flight(initial_speed, launch_angle_deg, delta_y, gravity):
 	angle_rad = math.radians(launch_angle_deg)
 	vy0 = initial_speed * math.sin(angle_rad)
@@ -144,27 +183,43 @@ def solve_time_of_flight(initial_speed, launch_angle_deg, delta_y, gravity):
 	return (vy0 + sqrt_disc) / gravity
 
 
+@njit(cache=True, fastmath=True)
 def sample_trajectory(initial_speed, launch_angle_deg, gravity, t_end, num_points=200):
+	# Returns an (num_points + 1, 2) array of (x, y) samples from t = 0 to t_end
 	angle_rad = math.radians(launch_angle_deg)
 	vx0 = initial_speed * math.cos(angle_rad)
 	vy0 = initial_speed * math.sin(angle_rad)
-	points = []
-	for i in range(num_points + 1):
-		t = t_end * (i / num_points)
-		x = vx0 * t
-		y = vy0 * t - 0.5 * gravity * t * t
-		points.append((x, y))
-	return points
+	ts = np.linspace(0.0, t_end, num_points + 1)
+	return np.column_stack((vx0 * ts, vy0 * ts - 0.5 * gravity * ts * ts))
 
 
-def draw_grid(surface, rect, origin_px, scale):
-	# Minor grid within rect
+def render_grid(size):
+	# Minor grid for a plot area of the given size, drawn once onto its own surface
 	step = 20
+	w, h = size
+	grid_surf = pygame.Surface(size)
+	grid_surf.fill(BACKGROUND_COLOR)
+	for x in range(0, w + 1, step):
+		pygame.draw.line(grid_surf, GRID_COLOR, (x, 0), (x, h))
+	for y in range(0, h + 1, step):
+		pygame.draw.line(grid_surf, GRID_COLOR, (0, y), (w, y))
+	return grid_surf
+
+
+def render_panel(size, labels):
+	# Side panel background, divider and static (surface, y) labels
+	panel_surf = pygame.Surface(size)
+	panel_surf.fill((24, 24, 30))
+	pygame.draw.line(panel_surf, (60, 60, 70), (0, 0), (0, size[1]), 1)
+	for label, label_y in labels:
+		panel_surf.blit(label, (20, label_y))
+	return panel_surf
+
+
+def draw_grid(surface, rect, grid_surf, origin_px, scale):
+	# Minor grid within rect (pre-rendered by render_grid)
+	surface.blit(grid_surf, rect.topleft)
 	x0, y0, w, h = rect
-	for x in range(x0, x0 + w + 1, step):
-		pygame.draw.line(surface, GRID_COLOR, (x, y0), (x, y0 + h))
-	for y in range(y0, y0 + h + 1, step):
-		pygame.draw.line(surface, GRID_COLOR, (x0, y), (x0 + w, y))
 
 	# Axes within rect - only draw if origin is within the rect
 	if x0 <= origin_px[0] <= x0 + w:
@@ -179,25 +234,42 @@ def world_to_screen(origin_px, scale, x_world, y_world):
 	return int(x), int(y)
 
 
+def world_to_screen_arr(origin_px, scale, xy):
+	# Vectorized world_to_screen for an (N, 2) array of world points
+	out = np.empty(xy.shape, dtype=np.int32)
+	out[:, 0] = origin_px[0] + xy[:, 0] * scale
+	out[:, 1] = origin_px[1] - xy[:, 1] * scale
+	return out
+
+
+def bounding_rect(points_px, pad=0):
+	# Smallest rect containing an (N, 2) array of pixel points, grown by pad on every side
+	x0, y0 = points_px.min(axis=0)
+	x1, y1 = points_px.max(axis=0)
+	return pygame.Rect(int(x0) - pad, int(y0) - pad, int(x1 - x0) + 1 + 2 * pad, int(y1 - y0) + 1 + 2 * pad)
+
+
 def clamp(value, lo, hi):
 	return max(lo, min(hi, value))
 
 
 class ProjectileSimulation:
 	def __init__(self):
-		self.reset()
-		self.trail_points = []
 		self.max_trail_length = 200
+		self.reset()
 		
 	def reset(self):
 		self.is_running = False
 		self.is_paused = False
 		self.time = 0.0
-		self.position = (0.0, 0.0)
-		self.velocity = (0.0, 0.0)
+		# Kinematic state vector: (x, y, vx, vy)
+		self.state = np.zeros(4, dtype=np.float64)
 		self.initial_velocity = (0.0, 0.0)
 		self.angle_deg = 0.0
-		self.trail_points = []
+		# Trail is a fixed-size ring buffer; _trail_head is the next slot to write
+		self._trail = np.empty((self.max_trail_length, 2), dtype=np.float32)
+		self._trail_head = 0
+		self._trail_count = 0
 		self.impact_time = None
 		self.range_m = 0.0
 		
@@ -210,11 +282,10 @@ class ProjectileSimulation:
 			initial_speed * math.sin(angle_rad)
 		)
 		self.velocity = self.initial_velocity
-		self.position = (0.0, 0.0)
 		self.is_running = True
 		self.is_paused = False
 		self.time = 0.0
-		self.trail_points = [(0.0, 0.0)]
+		self._push_trail(self.position)
 		
 		# Calculate impact time and range
 		vy0 = self.initial_velocity[1]
@@ -234,30 +305,46 @@ class ProjectileSimulation:
 		dt *= speed_multiplier
 		self.time += dt
 		
-		# Update position using physics
-		self.position = (
-			self.initial_velocity[0] * self.time,
-			self.initial_velocity[1] * self.time - 0.5 * GRAVITY * self.time * self.time
-		)
+		# Check for impact: clamp to the impact time so the final state is the landing point
+		if self.impact_time is not None and self.time >= self.impact_time:
+			self.is_running = False
+			self.time = self.impact_time
 		
-		# Update velocity
-		self.velocity = (
-			self.initial_velocity[0],
-			self.initial_velocity[1] - GRAVITY * self.time
-		)
+		# Update position and velocity from the closed-form solution
+		t = self.time
+		vx0, vy0 = self.initial_velocity
+		self.state[:] = (vx0 * t, vy0 * t - 0.5 * GRAVITY * t * t, vx0, vy0 - GRAVITY * t)
 		
 		# Add to trail
-		self.trail_points.append(self.position)
-		if len(self.trail_points) > self.max_trail_length:
-			self.trail_points.pop(0)
-			
-		# Check for impact
-		if self.impact_time and self.time >= self.impact_time:
-			self.is_running = False
-			self.time = self.impact_time
-			self.position = (self.range_m, 0.0)
-			self.velocity = (self.initial_velocity[0], -math.sqrt(self.initial_velocity[1]**2 - 2*GRAVITY*self.position[1]))
+		self._push_trail(self.position)
 			
+	@property
+	def position(self):
+		return self.state[:2]
+
+	@position.setter
+	def position(self, value):
+		self.state[:2] = value
+
+	@property
+	def velocity(self):
+		return self.state[2:]
+
+	@velocity.setter
+	def velocity(self, value):
+		self.state[2:] = value
+
+	def _push_trail(self, point):
+		self._trail[self._trail_head] = point
+		self._trail_head = (self._trail_head + 1) % self.max_trail_length
+		self._trail_count = min(self._trail_count + 1, self.max_trail_length)
+
+	def trail_array(self):
+		# Trail points oldest to newest as an (N, 2) array
+		if self._trail_count < self.max_trail_length:
+			return self._trail[:self._trail_count]
+		return np.roll(self._trail, -self._trail_head, axis=0)
+
 	def get_speed(self):
 		return math.sqrt(self.velocity[0]**2 + self.velocity[1]**2)
 		
@@ -280,6 +367,23 @@ def main():
 	big_font = pygame.font.SysFont("consolas", 24)
 	small_font = pygame.font.SysFont("consolas", 16)
 
+	# (msg, color) -> rendered readout line from the previous drawn frame
+	line_surfs = {}
+
+	# Static panel labels never change, so render them once: (surface, y offset)
+	static_labels = [
+		(big_font.render("Projectile Range", True, TEXT_COLOR), 20),
+		(font.render("Inputs", True, (180, 180, 190)), 60),
+		(font.render("Use Mouse Wheel / Up / Down", True, (160, 160, 170)), 250),
+		(font.render("Simulation Controls", True, (180, 180, 190)), 290),
+		(small_font.render("SPACE: Launch", True, TEXT_COLOR), 320),
+		(small_font.render("P: Pause/Resume", True, TEXT_COLOR), 340),
+		(small_font.render("R: Reset", True, TEXT_COLOR), 360),
+		(small_font.render("V: Toggle Vectors", True, TEXT_COLOR), 380),
+		(small_font.render("T: Toggle Trail", True, TEXT_COLOR), 400),
+		(small_font.render("+/-: Speed", True, TEXT_COLOR), 420),
+	]
+
 	# UI layout - will be updated on resize
 	panel_w = 320
 	window_width = WINDOW_WIDTH
@@ -301,8 +405,11 @@ def main():
 	input_vi = TextInput(pygame.Rect(panel_rect.x + 20, 80, panel_w - 40, 36), font, placeholder="Initial speed vi (m/s)")
 	input_vf = TextInput(pygame.Rect(panel_rect.x + 20, 150, panel_w - 40, 36), font, placeholder="Final speed vf (m/s, empty = vi)")
 	
+	grid_surf = None
+	panel_surf = None
+
 	def update_layout():
-		nonlocal panel_rect, plot_rect, usable_w, usable_h, input_vi, input_vf
+		nonlocal panel_rect, plot_rect, usable_w, usable_h, input_vi, input_vf, grid_surf, panel_surf
 		panel_rect = pygame.Rect(window_width - panel_w, 0, panel_w, window_height)
 		plot_rect = pygame.Rect(0, 0, window_width - panel_w, window_height)
 		usable_w = plot_rect.width - (margin_left + margin_right)
@@ -312,6 +419,12 @@ def main():
 		input_vi.rect = pygame.Rect(panel_rect.x + 20, 80, panel_w - 40, 36)
 		input_vf.rect = pygame.Rect(panel_rect.x + 20, 150, panel_w - 40, 36)
 
+		# Static backgrounds only change with the window size
+		grid_surf = render_grid(plot_rect.size)
+		panel_surf = render_panel(panel_rect.size, static_labels)
+
+	update_layout()
+
 	angle_deg = 45.0
 	angle_min = 0.0
 	angle_max = 89.9
@@ -337,11 +450,30 @@ def main():
 	popup_lines = []
 	popup_result = None
 
+	# Theoretical results only depend on (vi, vf, angle), so they are cached per key
+	theory_key = None
+	theory = None
+
+	# Dirty-rect presentation: while everything except the projectile and the panel
+	# readouts is unchanged, only those regions are pushed to the display
+	last_view_key = None
+	prev_sim_rect = None
+
+	# Frames are only rebuilt when something changed; idle frames just wait for input
+	dirty = True
+
 	running = True
 	while running:
-		dt = clock.tick(FPS) / 1000.0
+		dt = clock.tick(FPS if sim.is_running else IDLE_FPS) / 1000.0
 
 		for event in pygame.event.get():
+			# Any input that can change what is on screen forces a redraw
+			if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL, pygame.VIDEORESIZE):
+				dirty = True
+			elif event.type == pygame.VIDEOEXPOSE:
+				dirty = True
+				last_view_key = None
+
 			if popup_active:
 				if event.type == pygame.QUIT:
 					running = False
@@ -360,6 +492,7 @@ def main():
 				window_height = max(480, event.h)
 				screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
 				update_layout()
+				theory_key = None
 			elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
 				running = False
 			elif event.type == pygame.MOUSEWHEEL:
@@ -409,9 +542,15 @@ def main():
 			input_vi.handle_event(event)
 			input_vf.handle_event(event)
 
+		cursor_rects = []
 		if not popup_active:
-			input_vi.update(dt)
-			input_vf.update(dt)
+			for text_input in (input_vi, input_vf):
+				cursor_visible = text_input.cursor_visible
+				text_input.update(dt)
+				if text_input.cursor_visible != cursor_visible:
+					cursor_rects.append(text_input.cursor_rect())
+			if sim.is_running and not sim.is_paused:
+				dirty = True
 			sim.update(dt, speed_multiplier)
 
 			# Check hit against enemy/target while running
@@ -424,35 +563,25 @@ def main():
 					sim.stop()
 			elif hit_target and explosion_time > 0.0:
 				explosion_time = max(0.0, explosion_time - dt)
+				dirty = True
+
+		if not dirty:
+			if cursor_rects:
+				# Only a cursor blinked: repaint the input boxes and present just the cursors
+				input_vi.draw(screen)
+				input_vf.draw(screen)
+				pygame.display.update(cursor_rects)
+			continue
+		dirty = False
 
-		screen.fill(BACKGROUND_COLOR)
-
-		# Draw left plot background
-		pygame.draw.rect(screen, BACKGROUND_COLOR, plot_rect)
-
-		# Side panel background
-		pygame.draw.rect(screen, (24, 24, 30), panel_rect)
-		pygame.draw.line(screen, (60, 60, 70), (panel_rect.x, 0), (panel_rect.x, window_height), 1)
-
-		# Titles
-		screen.blit(big_font.render("Projectile Range", True, TEXT_COLOR), (panel_rect.x + 20, 20))
+		# Side panel background, titles, hints and simulation controls
+		screen.blit(panel_surf, panel_rect.topleft)
 
 		# Angle display
 		angle_label = big_font.render(f"Angle: {angle_deg:.1f}°", True, ACCENT_COLOR)
 		screen.blit(angle_label, (panel_rect.x + 20, 220))
-		screen.blit(font.render("Use Mouse Wheel / Up / Down", True, (160, 160, 170)), (panel_rect.x + 20, 250))
-
-		# Simulation controls
-		screen.blit(font.render("Simulation Controls", True, (180, 180, 190)), (panel_rect.x + 20, 290))
-		screen.blit(small_font.render("SPACE: Launch", True, TEXT_COLOR), (panel_rect.x + 20, 320))
-		screen.blit(small_font.render("P: Pause/Resume", True, TEXT_COLOR), (panel_rect.x + 20, 340))
-		screen.blit(small_font.render("R: Reset", True, TEXT_COLOR), (panel_rect.x + 20, 360))
-		screen.blit(small_font.render("V: Toggle Vectors", True, TEXT_COLOR), (panel_rect.x + 20, 380))
-		screen.blit(small_font.render("T: Toggle Trail", True, TEXT_COLOR), (panel_rect.x + 20, 400))
-		screen.blit(small_font.render("+/-: Speed", True, TEXT_COLOR), (panel_rect.x + 20, 420))
 
 		# Inputs
-		screen.blit(font.render("Inputs", True, (180, 180, 190)), (panel_rect.x + 20, 60))
 		input_vi.draw(screen)
 		input_vf.draw(screen)
 
@@ -468,45 +597,56 @@ def main():
 		# Start messages near the bottom of the panel but ensure they stay inside the panel
 		message_lines = []
 
-		# Calculate theoretical trajectory for visualization
-		theoretical_trajectory = []
-		theoretical_range = 0.0
-		theoretical_t_flight = 0.0
-		t_flight = None
-		vf_effective = None
-		if vi is not None and vi > 0:
-			if vf is None:
-				vf_effective = vi
-			else:
-				vf_effective = vf
+		# Calculate theoretical trajectory for visualization (only when inputs change)
+		key = (vi, vf, round(angle_deg, 3))
+		if key != theory_key:
+			theory_key = key
+			angle_rad = math.radians(angle_deg)
+			cos_a = math.cos(angle_rad)
+			sin_a = math.sin(angle_rad)
+			theoretical_trajectory = None
+			theoretical_range = 0.0
+			theoretical_t_flight = 0.0
+			theory_bounds = None
+			t_flight = None
+			delta_y = 0.0
+			if vi is not None and vi > 0:
+				if vf is None:
+					vf_effective = vi
+				else:
+					vf_effective = vf
 
-			delta_y = compute_delta_y_from_speeds(vi, vf_effective, GRAVITY)
-			t_flight = solve_time_of_flight(vi, angle_deg, delta_y, GRAVITY)
+				delta_y = compute_delta_y_from_speeds(vi, vf_effective, GRAVITY)
+				t_flight = solve_time_of_flight(vi, angle_deg, delta_y, GRAVITY)
 
-			if t_flight is None or t_flight <= 0:
-				message_lines.append(("No solution for given angle and speeds.", ERROR_COLOR))
-				theoretical_trajectory = []
-				theoretical_range = None
-			else:
-				vx = vi * math.cos(math.radians(angle_deg))
-				theoretical_range = vx * t_flight
-				theoretical_t_flight = t_flight
-				theoretical_trajectory = sample_trajectory(vi, angle_deg, GRAVITY, t_flight, num_points=300)
+				if t_flight is None or t_flight <= 0:
+					theoretical_range = None
+				else:
+					theoretical_range = vi * cos_a * t_flight
+					theoretical_t_flight = t_flight
+					theoretical_trajectory = sample_trajectory(vi, angle_deg, GRAVITY, t_flight, num_points=300)
+					# Bounding box corners as a (2, 2) array: [[min_x, min_y], [max_x, max_y]]
+					theory_bounds = np.array((theoretical_trajectory.min(axis=0), theoretical_trajectory.max(axis=0)))
+			theory = (cos_a, sin_a, theoretical_trajectory, theoretical_range, theoretical_t_flight,
+				theory_bounds, t_flight, delta_y)
+		(cos_a, sin_a, theoretical_trajectory, theoretical_range, theoretical_t_flight,
+			theory_bounds, t_flight, delta_y) = theory
+
+		if theoretical_range is None:
+			message_lines.append(("No solution for given angle and speeds.", ERROR_COLOR))
 
 		# Auto-fit scale and origin for visualization
-		all_points = []
-		if theoretical_trajectory:
-			all_points.extend(theoretical_trajectory)
-		if sim.trail_points:
-			all_points.extend(sim.trail_points)
-		if sim.position != (0, 0):
-			all_points.append(sim.position)
-			
-		if all_points:
-			xs = [p[0] for p in all_points]
-			ys = [p[1] for p in all_points]
-			min_x, max_x = min(xs), max(xs)
-			min_y, max_y = min(ys), max(ys)
+		trail = sim.trail_array()
+		candidates = [trail]
+		if theory_bounds is not None:
+			candidates.append(theory_bounds)
+		if sim.position.any():
+			candidates.append(np.array((sim.position,)))
+		pts = np.concatenate(candidates, axis=0)
+
+		if pts.size:
+			min_x, min_y = pts.min(axis=0)
+			max_x, max_y = pts.max(axis=0)
 			# Ensure origin (0,0) is considered for better framing
 			min_x = min(min_x, 0.0)
 			min_y = min(min_y, 0.0)
@@ -528,7 +668,7 @@ def main():
 			scale = 6.0
 
 		# Draw grid
-		draw_grid(screen, plot_rect, origin_px, scale)
+		draw_grid(screen, plot_rect, grid_surf, origin_px, scale)
 
 		# Draw mortar at origin with barrel pointing at angle_deg
 		mortar_base_px = world_to_screen(origin_px, scale, 0.0, 0.0)
@@ -541,20 +681,18 @@ def main():
 		# Barrel
 		barrel_len_m = 3.0
 		barrel_len_px = max(10, int(barrel_len_m * scale))
-		ang = math.radians(angle_deg)
 		barrel_end = (
-			mortar_base_px[0] + int(math.cos(ang) * barrel_len_px),
-			mortar_base_px[1] - int(math.sin(ang) * barrel_len_px)
+			mortar_base_px[0] + int(cos_a * barrel_len_px),
+			mortar_base_px[1] - int(sin_a * barrel_len_px)
 		)
 		pygame.draw.line(screen, (170, 220, 255), mortar_base_px, barrel_end, 3)
 		# Muzzle cap
 		pygame.draw.circle(screen, (255, 255, 255), barrel_end, 3)
 
 		# Draw theoretical trajectory
-		if theoretical_trajectory:
-			points_px = [world_to_screen(origin_px, scale, x, y) for (x, y) in theoretical_trajectory]
-			for i in range(1, len(points_px)):
-				pygame.draw.line(screen, (100, 100, 120), points_px[i - 1], points_px[i], 1)
+		if theoretical_trajectory is not None:
+			points_arr_px = world_to_screen_arr(origin_px, scale, theoretical_trajectory)
+			pygame.draw.lines(screen, (100, 100, 120), False, points_arr_px.tolist(), 1)
 
 		# Draw enemy/target
 		enemy_px = world_to_screen(origin_px, scale, enemy_pos[0], enemy_pos[1])
@@ -566,48 +704,60 @@ def main():
 			expansion = int((0.5 - explosion_time) * 40)
 			pygame.draw.circle(screen, (255, 200, 80), enemy_px, enemy_screen_radius + expansion, 2)
 
+		# Pixels touched by the trail, projectile and velocity vector this frame
+		sim_points_px = []
+
 		# Draw simulation trail
-		if show_trail and sim.trail_points:
-			trail_px = [world_to_screen(origin_px, scale, x, y) for (x, y) in sim.trail_points]
-			for i in range(1, len(trail_px)):
-				alpha = i / len(trail_px)
-				color = (int(TRAIL_COLOR[0] * alpha), int(TRAIL_COLOR[1] * alpha), int(TRAIL_COLOR[2] * alpha))
-				pygame.draw.line(screen, color, trail_px[i - 1], trail_px[i], 2)
+		if show_trail and len(trail) > 1:
+			trail_arr_px = world_to_screen_arr(origin_px, scale, trail)
+			sim_points_px.append(trail_arr_px)
+			trail_px = trail_arr_px.tolist()
+			# Quantize the fade into a few buckets and draw each one as a single polyline
+			n = len(trail_px)
+			for b in range(TRAIL_FADE_STEPS):
+				start = b * (n - 1) // TRAIL_FADE_STEPS
+				end = (b + 1) * (n - 1) // TRAIL_FADE_STEPS
+				if end <= start:
+					continue
+				pygame.draw.lines(screen, TRAIL_FADE_COLORS[b], False, trail_px[start:end + 1], 2)
 
 		# Draw projectile
-		if sim.is_running or sim.position != (0, 0):
+		if sim.is_running or sim.position.any():
 			proj_x, proj_y = world_to_screen(origin_px, scale, sim.position[0], sim.position[1])
 			pygame.draw.circle(screen, SIM_COLOR, (proj_x, proj_y), 6)
 			pygame.draw.circle(screen, (255, 255, 255), (proj_x, proj_y), 6, 2)
+			sim_points_px.append(((proj_x, proj_y),))
 
 		# Draw velocity vector
-		if show_vectors and sim.is_running and sim.velocity != (0, 0):
+		if show_vectors and sim.is_running and sim.velocity.any():
 			proj_x, proj_y = world_to_screen(origin_px, scale, sim.position[0], sim.position[1])
 			# Scale vector for visibility
 			vector_scale = 0.1
 			end_x = proj_x + int(sim.velocity[0] * vector_scale)
 			end_y = proj_y - int(sim.velocity[1] * vector_scale)  # Flip Y for screen coordinates
 			pygame.draw.line(screen, VECTOR_COLOR, (proj_x, proj_y), (end_x, end_y), 3)
-			# Arrow head
-			angle = math.atan2(sim.velocity[1], sim.velocity[0])
+			# Arrow head: rotate the unit velocity by the fixed barb angle (no trig per frame)
+			vx, vy = sim.velocity
+			inv_mag = 1.0 / math.hypot(vx, vy)
+			ux, uy = vx * inv_mag, vy * inv_mag
 			arrow_size = 8
-			head1_x = end_x - int(arrow_size * math.cos(angle - 0.5))
-			head1_y = end_y + int(arrow_size * math.sin(angle - 0.5))
-			head2_x = end_x - int(arrow_size * math.cos(angle + 0.5))
-			head2_y = end_y + int(arrow_size * math.sin(angle + 0.5))
+			head1_x = end_x - int(arrow_size * (ux * ARROW_HEAD_COS + uy * ARROW_HEAD_SIN))
+			head1_y = end_y + int(arrow_size * (uy * ARROW_HEAD_COS - ux * ARROW_HEAD_SIN))
+			head2_x = end_x - int(arrow_size * (ux * ARROW_HEAD_COS - uy * ARROW_HEAD_SIN))
+			head2_y = end_y + int(arrow_size * (uy * ARROW_HEAD_COS + ux * ARROW_HEAD_SIN))
 			pygame.draw.polygon(screen, VECTOR_COLOR, [(end_x, end_y), (head1_x, head1_y), (head2_x, head2_y)])
+			sim_points_px.append(((proj_x, proj_y), (end_x, end_y), (head1_x, head1_y), (head2_x, head2_y)))
 
 		# Draw landing point and range marker
-		if theoretical_range is not None and theoretical_trajectory:
-			land_x, land_y = theoretical_trajectory[-1]
-			lx, ly = world_to_screen(origin_px, scale, land_x, land_y)
+		if theoretical_range is not None and theoretical_trajectory is not None:
+			lx, ly = int(points_arr_px[-1, 0]), int(points_arr_px[-1, 1])
 			pygame.draw.circle(screen, (255, 180, 100), (lx, ly), 5)
 
 			# Range guide on x-axis at y=0 if inside plot
-			axis_y = world_to_screen(origin_px, scale, 0, 0)[1]
-			pygame.draw.line(screen, (120, 120, 140), (world_to_screen(origin_px, scale, 0, 0)[0], axis_y), (lx, axis_y), 1)
+			ox_px, axis_y = world_to_screen(origin_px, scale, 0, 0)
+			pygame.draw.line(screen, (120, 120, 140), (ox_px, axis_y), (lx, axis_y), 1)
 			pygame.draw.line(screen, (120, 120, 140), (lx, axis_y - 6), (lx, axis_y + 6), 1)
-			pygame.draw.line(screen, (120, 120, 140), (world_to_screen(origin_px, scale, 0, 0)[0], axis_y - 6), (world_to_screen(origin_px, scale, 0, 0)[0], axis_y + 6), 1)
+			pygame.draw.line(screen, (120, 120, 140), (ox_px, axis_y - 6), (ox_px, axis_y + 6), 1)
 
 		# Simulation status and real-time data
 		if sim.is_running:
@@ -641,8 +791,7 @@ def main():
 				message_lines.append((f"vf = {vf:.3f} m/s", TEXT_COLOR))
 			else:
 				message_lines.append(("vf = (assumed equal to vi)", (160, 160, 170)))
-			if theoretical_trajectory:
-				delta_y = compute_delta_y_from_speeds(vi, vf_effective if vf is not None else vi, GRAVITY)
+			if theoretical_trajectory is not None:
 				message_lines.append((f"Δy (land - launch) = {delta_y:.3f} m", TEXT_COLOR))
 				message_lines.append((f"Time of flight = {theoretical_t_flight:.3f} s", TEXT_COLOR))
 				message_lines.append((f"Range = {theoretical_range:.3f} m", (180, 255, 180)))
@@ -674,13 +823,19 @@ def main():
 		# Use the same color as the panel so the block fully hides what's underneath
 		pygame.draw.rect(screen, (24, 24, 30), (bg_x, bg_y, bg_w, bg_h))
 		# Draw the lines
+		# Reuse last frame's rendered lines so only readouts whose text changed are re-rendered
+		rendered = {}
 		for i, (msg, col) in enumerate(lines_to_show):
-			r = font.render(msg, True, col)
+			r = line_surfs.get((msg, col))
+			if r is None:
+				r = font.render(msg, True, col)
+			rendered[(msg, col)] = r
 			screen.blit(r, (panel_rect.x + 20, info_start + i * line_h))
+		line_surfs = rendered
 
 
 		# Show popup if simulation just ended (not running, not paused, and not already shown)
-		if not popup_active and not sim.is_running and (sim.position != (0, 0) or hit_target):
+		if not popup_active and not sim.is_running and (sim.position.any() or hit_target):
 			# Only show if a launch was performed
 			if t_flight is not None and t_flight > 0:
 				popup_lines = []
@@ -699,9 +854,31 @@ def main():
 		if popup_active:
 			show_popup(screen, font, big_font, popup_lines, window_width, window_height)
 			pygame.display.flip()
+			last_view_key = None
 			continue
 
-		pygame.display.flip()
+		# Anything that moves the view, the static plot items or the angle label needs a
+		# full flip; otherwise only the projectile region and the panel readouts changed
+		sim_rect = bounding_rect(np.concatenate(sim_points_px), pad=8) if sim_points_px else None
+		view_key = (
+			screen.get_size(), origin_px, scale, angle_deg, theory_key, tuple(enemy_pos),
+			hit_target, explosion_time, show_trail, show_vectors
+		)
+		if view_key != last_view_key:
+			pygame.display.flip()
+		else:
+			dirty_rects = [
+				pygame.Rect(panel_rect.x, bg_y, panel_rect.width, panel_rect.bottom - bg_y),
+				input_vi.rect,
+				input_vf.rect,
+			]
+			if sim_rect is not None:
+				dirty_rects.append(sim_rect)
+			if prev_sim_rect is not None:
+				dirty_rects.append(prev_sim_rect)
+			pygame.display.update(dirty_rects)
+		last_view_key = view_key
+		prev_sim_rect = sim_rect
 
 	pygame.quit()
 	sys.exit(0)